@@ -3,16 +3,60 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_migrate import Migrate
 from flask_admin import Admin
+from flask_session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from .json_provider import OrjsonProvider
+import os
+import redis
+import sqlite3
 
 # Create an instance of the Flask application
 app = Flask(__name__)
 
-# Load configuration settings from the DevelopmentConfig class in the config module
-app.config.from_object('config.DevelopmentConfig')
+# Load configuration settings from the config module, DevelopmentConfig unless APP_CONFIG names another class
+app.config.from_object('config.' + os.environ.get('APP_CONFIG', 'DevelopmentConfig'))
+
+# Serialise JSON responses and parse JSON requests with orjson
+app.json = OrjsonProvider(app)
 
 # Initialize SQLAlchemy with the Flask app for database operations
 db = SQLAlchemy(app)
 
+
+# Settings applied to every new SQLite connection
+SQLITE_PRAGMAS = (
+    'foreign_keys=ON',
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'mmap_size=268435456',
+    'cache_size=-64000',
+    'temp_store=MEMORY',
+)
+
+
+# Configure every new SQLite connection
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Applies per-connection SQLite settings.
+
+    SQLite leaves foreign key enforcement off by default, which would ignore the
+    ON DELETE CASCADE rules declared on the models. Write-ahead logging with
+    synchronous=NORMAL avoids an fsync per commit and lets reads run alongside a
+    write, while the cache, mmap and temp_store settings keep hot pages in memory.
+
+    Parameters:
+    dbapi_connection: The raw DB-API connection that was just opened.
+    connection_record: The pool's record for the connection (unused).
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f'PRAGMA {pragma}')
+        cursor.close()
+
+
 # Initialize Migrate with the Flask app and SQLAlchemy db for database migrations
 migrate = Migrate(app, db, render_as_batch=True)
 
@@ -20,10 +64,44 @@ migrate = Migrate(app, db, render_as_batch=True)
 admin = Admin(app, template_mode='bootstrap4')
 
 
+# Configure server-side sessions when a Redis instance is available
+def configure_sessions(app):
+    """
+    Configures server-side session storage in Redis.
+
+    When REDIS_URL is set, sessions are kept in Redis and the cookie only carries
+    the session ID, so requests no longer sign and re-serialise the whole session.
+    Without it, Flask's default signed-cookie sessions are left in place.
+
+    Parameters:
+    app: The Flask application instance.
+
+    Returns:
+    The Redis client, or None if Redis is not configured.
+    """
+    if not app.config.get('REDIS_URL'):
+        return None
+
+    client = redis.Redis.from_url(app.config['REDIS_URL'], socket_keepalive=True)
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = client
+    Session(app)
+    return client
+
+
+# Call the function to configure sessions, keeping the client for other Redis users
+redis_client = configure_sessions(app)
+
+
 # Import views and models after app initialization to avoid circular imports
 from app import views, models
 
 
+# Add the models to the admin view for easy management
+from .admin_setup import init_admin
+init_admin(admin, db)
+
+
 # Register blueprints for different parts of the app
 def register_blueprints(app):
     """
@@ -71,8 +149,8 @@ def configure_login_manager(app):
         Returns:
         The User object or None if not found.
         """
-        from .models import User
-        return db.session.get(User, id)
+        from .auth_service import load_cached_user
+        return load_cached_user(id)
 
 
 # Call the function to configure the login manager
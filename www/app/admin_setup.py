@@ -0,0 +1,18 @@
+from flask_admin.contrib.sqla import ModelView
+from .models import User, Car, UserInteraction
+
+
+def init_admin(admin, db):
+    """
+    Registers the model views with the admin interface.
+
+    Called once while the app is being set up, so importing the views module
+    does not construct the admin views as a side effect.
+
+    Parameters:
+    admin: The Flask-Admin instance.
+    db: The SQLAlchemy instance whose session the views use.
+    """
+    admin.add_view(ModelView(User, db.session))
+    admin.add_view(ModelView(Car, db.session))
+    admin.add_view(ModelView(UserInteraction, db.session))
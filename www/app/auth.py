@@ -2,6 +2,7 @@ from flask import Blueprint, render_template, request, flash, redirect, url_for,
 from flask_login import login_user, login_required, logout_user, current_user
 from .auth_service import authenticate_and_login, register_and_login
 from .forms import LoginForm, RegistrationForm
+from . import redis_client
 
 # Blueprint setup for authentication routes
 auth = Blueprint('auth', __name__)
@@ -16,6 +17,42 @@ MAX_LOGIN_ATTEMPTS_REACHED = 'Maximum sign-in attempts reached.'
 # Maximum allowed login attempts
 MAX_LOGIN_ATTEMPTS = 3
 
+# Window (in seconds) over which login attempts are counted in Redis
+LOGIN_ATTEMPTS_WINDOW = 3600
+
+
+def login_attempts_key(email):
+    """
+    Builds the Redis key counting login attempts for the requesting client and email.
+
+    Parameters:
+    email (str): The email being signed in to.
+
+    Returns:
+    str: The Redis key.
+    """
+    return f'login_attempts:{request.remote_addr}:{email}'
+
+
+def bump_login_attempts(email):
+    """
+    Counts a login attempt in Redis for the requesting client and email.
+
+    Unlike the session counter, this cannot be reset by discarding the cookie.
+    The counter expires after LOGIN_ATTEMPTS_WINDOW seconds.
+
+    Parameters:
+    email (str): The email being signed in to.
+
+    Returns:
+    int: The number of attempts made within the current window, including this one.
+    """
+    key = login_attempts_key(email)
+    pipe = redis_client.pipeline()
+    pipe.incr(key)
+    pipe.expire(key, LOGIN_ATTEMPTS_WINDOW)
+    return pipe.execute()[0]
+
 
 @auth.route('/login', methods=['GET', 'POST'])
 def login():
@@ -32,17 +69,27 @@ def login():
     """
     form = LoginForm()
 
-    if session.get('login_attempts', 0) >= MAX_LOGIN_ATTEMPTS:
+    # Read the session counter once; it is written back at most once below
+    attempts = session.get('login_attempts', 0)
+    if attempts >= MAX_LOGIN_ATTEMPTS:
         flash(MAX_LOGIN_ATTEMPTS_REACHED, ERROR)
         return redirect(url_for('auth.signup'))
 
     if form.validate_on_submit():
+        # Rate-limit by client and email before paying for a password hash
+        if redis_client is not None and bump_login_attempts(form.email.data) > MAX_LOGIN_ATTEMPTS:
+            flash(MAX_LOGIN_ATTEMPTS_REACHED, ERROR)
+            return redirect(url_for('auth.signup'))
+
         if authenticate_and_login(form.email.data, form.password.data):
-            # Reset login attempts on successful login
-            session['login_attempts'] = 0
+            # Reset login attempts on successful login, leaving an untouched session unmodified
+            if attempts:
+                session['login_attempts'] = 0
+            if redis_client is not None:
+                redis_client.delete(login_attempts_key(form.email.data))
             return redirect(url_for('views.home'))
         else:
-            session['login_attempts'] = session.get('login_attempts', 0) + 1
+            session['login_attempts'] = attempts + 1
             flash(INVALID_CREDENTIALS, ERROR)
 
     return render_template("/admin/login.html", form=form, user=current_user, title='Login')
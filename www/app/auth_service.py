@@ -1,13 +1,37 @@
-from werkzeug.security import generate_password_hash, check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from cachetools import TTLCache
 from flask_login import login_user
 from flask import flash
 from .models import User
-from . import db
+from . import app, db, redis_client
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
-import re
+from sqlalchemy.orm import make_transient_to_detached, raiseload
+import hashlib
+import hmac
+import pickle
+import threading
 
-# Constants for hash method and flash message contents
-HASH_TYPE = 'pbkdf2:sha256'
+# Argon2id hasher; the cost comes from config (OWASP minimum of 19 MiB and 2 passes by default)
+PASSWORD_HASHER = PasswordHasher(
+    time_cost=app.config['ARGON2_TIME_COST'],
+    memory_cost=app.config['ARGON2_MEMORY_COST'],
+    parallelism=1)
+
+# Prefix of hashes created by the previous Werkzeug PBKDF2 scheme
+LEGACY_HASH_PREFIX = 'pbkdf2:'
+LEGACY_DEFAULT_ITERATIONS = 600000
+
+# Recently verified credentials: sha256(email:password) -> stored hash at verification time
+CREDENTIAL_CACHE = TTLCache(maxsize=10000, ttl=300)
+CREDENTIAL_CACHE_LOCK = threading.Lock()
+
+# Seconds a user row is cached in Redis for the login manager; the password hash is never cached
+USER_CACHE_TTL = 60
+USER_CACHE_COLUMNS = tuple(c.name for c in User.__table__.columns if c.name != 'password')
+
+# Constants for flash message contents
 SUCCESS = 'success'
 ERROR = 'error'
 
@@ -17,7 +41,6 @@ ACCOUNT_EXISTS = 'An account with this email already exists.'
 
 PWD_LEN_MSG = "ERROR: Password must be between 7 and 18 characters long."
 PASSWORD_MISMATCH = 'Passwords do not match.'
-PWD_LETTERS_NUMBERS_MSG = "ERROR: Password must include both letters and numbers."
 
 EMAIL_LEN_MSG = "ERROR: Enter an E-mail between 2 and 20 characters long."
 NAME_LEN_MSG = "ERROR: Enter a name between 5 and 30 characters long."
@@ -25,7 +48,7 @@ NAME_CHARS_ONLY_MSG = "ERROR: Name must contain only letters."
 
 def generate_hash(password):
     """
-    Generates a password hash using a specified hashing algorithm.
+    Generates an Argon2id password hash.
 
     Parameters:
     password (str): The password to be hashed.
@@ -33,7 +56,132 @@ def generate_hash(password):
     Returns:
     str: The generated password hash.
     """
-    return generate_password_hash(password, method=HASH_TYPE)
+    return PASSWORD_HASHER.hash(password)
+
+
+def _pbkdf2_verify(stored_hash, password):
+    """
+    Checks a password against a legacy Werkzeug PBKDF2 hash.
+
+    Calls hashlib.pbkdf2_hmac directly, which runs in OpenSSL and releases the GIL.
+
+    Parameters:
+    stored_hash (str): Hash in the form 'pbkdf2:<algorithm>[:<iterations>]$<salt>$<hex digest>'.
+    password (str): The password to verify.
+
+    Returns:
+    bool: True if the password matches the hash, False otherwise.
+    """
+    try:
+        method, salt, digest = stored_hash.split('$', 2)
+        _, algorithm, *iterations = method.split(':')
+        rounds = int(iterations[0]) if iterations else LEGACY_DEFAULT_ITERATIONS
+        expected = bytes.fromhex(digest)
+        actual = hashlib.pbkdf2_hmac(algorithm, password.encode(), salt.encode(), rounds)
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
+
+
+def verify_password(user, password):
+    """
+    Verifies a password against the stored hash of a user.
+
+    Legacy PBKDF2 hashes are still accepted and, like Argon2 hashes with
+    outdated parameters, are transparently re-hashed on a successful match.
+
+    Successful matches are cached for a few minutes so repeat logins skip the
+    hash. A cache entry only counts while the stored hash is unchanged, so a
+    password change or re-created account invalidates it implicitly.
+
+    Parameters:
+    user (User): The user whose stored hash is checked.
+    password (str): The password to verify.
+
+    Returns:
+    bool: True if the password matches, False otherwise.
+    """
+    key = hashlib.sha256(f"{user.email}:{password}".encode()).digest()
+    with CREDENTIAL_CACHE_LOCK:
+        cached_hash = CREDENTIAL_CACHE.get(key)
+    if cached_hash is not None and hmac.compare_digest(cached_hash, user.password):
+        return True
+
+    if user.password.startswith(LEGACY_HASH_PREFIX):
+        if not _pbkdf2_verify(user.password, password):
+            return False
+        needs_rehash = True
+    else:
+        try:
+            PASSWORD_HASHER.verify(user.password, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        needs_rehash = PASSWORD_HASHER.check_needs_rehash(user.password)
+
+    if needs_rehash:
+        user.password = generate_hash(password)
+        db.session.commit()
+        forget_cached_user(user.id)
+
+    with CREDENTIAL_CACHE_LOCK:
+        CREDENTIAL_CACHE[key] = user.password
+    return True
+
+
+def user_cache_key(user_id):
+    """
+    Builds the Redis key under which a user row is cached.
+
+    Parameters:
+    user_id (int): The ID of the user.
+
+    Returns:
+    str: The Redis key.
+    """
+    return f'user:{user_id}'
+
+
+def load_cached_user(user_id):
+    """
+    Loads a user by ID, going through the Redis user cache when Redis is configured.
+
+    Cached users are re-attached to the session without a SELECT; the password
+    column is not cached and loads on first access.
+
+    Parameters:
+    user_id (int | str): The ID of the user.
+
+    Returns:
+    User: The user, or None if not found.
+    """
+    user_id = int(user_id)
+    if redis_client is None:
+        return db.session.get(User, user_id)
+
+    key = user_cache_key(user_id)
+    blob = redis_client.get(key)
+    if blob is not None:
+        user = User(**pickle.loads(blob))
+        make_transient_to_detached(user)
+        db.session.add(user)
+        return user
+
+    user = db.session.get(User, user_id)
+    if user is not None:
+        row = {name: getattr(user, name) for name in USER_CACHE_COLUMNS}
+        redis_client.setex(key, USER_CACHE_TTL, pickle.dumps(row))
+    return user
+
+
+def forget_cached_user(user_id):
+    """
+    Drops a user from the Redis user cache after their row changes.
+
+    Parameters:
+    user_id (int): The ID of the user.
+    """
+    if redis_client is not None:
+        redis_client.delete(user_cache_key(user_id))
 
 
 def validate_password(password1, password2):
@@ -68,8 +216,11 @@ def authenticate_and_login(email, password):
     Returns:
     bool: True if the user is authenticated and logged in, False otherwise.
     """
-    user = User.query.filter_by(email=email).first()
-    if user and check_password_hash(user.password, password):
+    # Relationships are never needed to sign in, so accidental lazy loads raise
+    user = db.session.execute(
+        select(User).where(User.email == email).options(raiseload('*'))
+    ).scalar_one_or_none()
+    if user and verify_password(user, password):
         login_user(user, remember=True)
         flash(LOGIN_SUCCESS, SUCCESS)
         return True
@@ -82,6 +233,9 @@ def valid_inputs(email, first_name, password):
     Database validation for form input data. 
     Returns True if all inputs are valid, False otherwise.
 
+    Only the checks guarding column sizes are repeated here; password rules
+    are enforced once by RegistrationForm.
+
     Parameters:
     email (str): The email of the user.
     first_name (str): The first name of the user.
@@ -102,12 +256,6 @@ def valid_inputs(email, first_name, password):
             else NAME_CHARS_ONLY_MSG, ERROR)
         return False
 
-    # Check for password length and alphanumeric composition
-    if not (7 <= len(password) <= 18) or not re.search(r"[a-zA-Z]", password) or not re.search(r"[0-9]", password):
-        flash(PWD_LEN_MSG if len(password) <
-            7 else PWD_LETTERS_NUMBERS_MSG, ERROR)
-        return False
-
     return True
 
 
@@ -128,9 +276,13 @@ def create_user(email, first_name, password):
         return None
 
     hashed_password = generate_hash(password)
-    new_user = User(email=email, first_name=first_name, password=hashed_password)
-    db.session.add(new_user)
+
+    # A single INSERT ... RETURNING, bypassing the unit-of-work flush
+    stmt = insert(User).values(
+        email=email, first_name=first_name, password=hashed_password
+    ).returning(User)
     try:
+        new_user = db.session.scalars(stmt).one()
         db.session.commit()
         return new_user
     except IntegrityError:
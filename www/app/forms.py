@@ -1,44 +1,56 @@
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, SubmitField
-from wtforms.validators import DataRequired, Length, Email, EqualTo, ValidationError
+from wtforms.validators import DataRequired, Length, EqualTo, Regexp, ValidationError
 import re
 
 # Constants for validation error messages
 EMAIL_LEN_MSG = "ERROR: Enter an E-mail between 2 and 20 characters long."
+EMAIL_FORMAT_MSG = "ERROR: Enter a valid E-mail address."
 NAME_LEN_MSG = "ERROR: Enter a name between 5 and 30 characters long."
 PWD_LEN_MSG = "ERROR: Password must be between 7 and 18 characters long."
 PWD_MATCH_MSG = "ERROR: Passwords must match."
 NAME_CHARS_ONLY_MSG = "ERROR: Name must contain only letters."
 PWD_LETTERS_NUMBERS_MSG = "ERROR: Password must include both letters and numbers."
 
+# Anchored pattern for (lower-cased) email addresses; length is checked separately
+EMAIL_PATTERN = re.compile(r'[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}')
+
+# Password must contain at least one ASCII letter and one digit
+PASSWORD_PATTERN = re.compile(r'(?=.*[A-Za-z])(?=.*[0-9])')
+
 
 class BaseUserForm(FlaskForm):
     """
     A base form for user-related operations.
 
     Attributes:
-        email (StringField): Email field with required validation and email format checking.
+        email (StringField): Email field with required validation and length checking.
     
     Methods:
         validate_email:
-            Normalizes email input to lowercase.
+            Normalizes email input to lowercase and checks its format.
     """
     email = StringField('Email', validators=[
-        DataRequired(), Email(), Length(min=5, max=30, message=EMAIL_LEN_MSG)])
+        DataRequired(), Length(min=5, max=30, message=EMAIL_LEN_MSG)])
 
     def validate_email(form, field):
         """
         Validate and normalize the email field.
 
+        The format is checked with a single precompiled pattern rather than a
+        full email_validator parse.
+
         Parameters:
             form: The instance of the form where the field exists.
             field: The field to be validated and normalized.
 
-        Returns:
-            None: The field data is modified in place.
+        Raises:
+            ValidationError: If the email is not a valid address.
         """
         # Normalize email to lowercase
         field.data = field.data.lower()
+        if not EMAIL_PATTERN.fullmatch(field.data):
+            raise ValidationError(EMAIL_FORMAT_MSG)
 
 
 class LoginForm(BaseUserForm):
@@ -63,7 +75,7 @@ class RegistrationForm(BaseUserForm):
 
     Attributes:
         first_name (StringField): First name field with required validation and length constraints.
-        password (PasswordField): Password field with required validation and length constraint.
+        password (PasswordField): Password field with required validation, length and letters-and-numbers constraints.
         confirm_password (PasswordField): Confirm password field with required validation and matching constraint.
         submit (SubmitField): Submit button for the form.
 
@@ -75,7 +87,8 @@ class RegistrationForm(BaseUserForm):
                              DataRequired(), Length(min=2, max=20, message=NAME_LEN_MSG)])
     password = PasswordField('Password', validators=[
         DataRequired(),
-        Length(min=7, max=18, message=PWD_LEN_MSG)
+        Length(min=7, max=18, message=PWD_LEN_MSG),
+        Regexp(PASSWORD_PATTERN, message=PWD_LETTERS_NUMBERS_MSG)
     ])
     confirm_password = PasswordField('Confirm Password', validators=[
         DataRequired(),
@@ -96,17 +109,3 @@ class RegistrationForm(BaseUserForm):
         """
         if not field.data.isalpha():
             raise ValidationError(NAME_CHARS_ONLY_MSG)
-        
-    def validate_password(form, field):
-        """
-        Custom validation method for the password field to ensure it includes both letters and numbers.
-
-        Parameters:
-            form: The instance of the form where the field exists.
-            field: The field to be validated.
-
-        Raises:
-            ValidationError: If the password does not contain both letters and numbers.
-        """
-        if not re.search(r"[a-zA-Z]", field.data) or not re.search(r"[0-9]", field.data) or not (7 <= len(field.data) <= 18):
-            raise ValidationError(PWD_LETTERS_NUMBERS_MSG)
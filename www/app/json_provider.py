@@ -0,0 +1,59 @@
+from flask.json.provider import DefaultJSONProvider
+import orjson
+
+# Keyword arguments from Flask that orjson can honour, or that it can safely ignore
+ORJSON_KWARGS = {'default', 'ensure_ascii', 'sort_keys', 'indent', 'separators'}
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serialises and parses with orjson.
+
+    Used by jsonify, request.get_json, the tojson template filter and the session
+    serializer. orjson always emits compact UTF-8, so ensure_ascii and separators
+    are ignored, and indent is limited to its two-space pretty printing.
+
+    Calls with keyword arguments orjson does not support, or values it cannot
+    encode (such as integers wider than 64 bits), fall back to the standard
+    library provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialises obj to a JSON string.
+
+        Parameters:
+        obj: The data to serialise.
+        kwargs: json.dumps style options passed by Flask.
+
+        Returns:
+        The JSON document as a str.
+        """
+        if not kwargs.keys() <= ORJSON_KWARGS:
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        """
+        Parses a JSON document.
+
+        Parameters:
+        s: The JSON document as str or bytes.
+        kwargs: json.loads style options, which fall back to the standard library.
+
+        Returns:
+        The decoded Python object.
+        """
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
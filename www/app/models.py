@@ -1,9 +1,7 @@
 from app import db
 from sqlalchemy.sql import func
 from flask_login import UserMixin
-
-# Constant fo default datetime
-DT = func.now()
+import functools
 
 
 class BaseModel(db.Model):
@@ -20,8 +18,12 @@ class BaseModel(db.Model):
     __abstract__ = True
 
     id = db.Column(db.Integer, primary_key=True, nullable=False)
-    created_at = db.Column(db.DateTime(timezone=True), default=DT)
-    updated_at = db.Column(db.DateTime(timezone=True), default=DT, onupdate=DT)
+    # Timestamps are set to CURRENT_TIMESTAMP inside the INSERT itself; the server defaults
+    # only cover tables created from these models, which the shipped app.db predates
+    created_at = db.Column(db.DateTime(timezone=True), default=func.now(),
+                           server_default=func.now(), nullable=False)
+    updated_at = db.Column(db.DateTime(timezone=True), default=func.now(),
+                           server_default=func.now(), onupdate=func.now())
 
 
 class User(BaseModel, UserMixin):
@@ -34,7 +36,8 @@ class User(BaseModel, UserMixin):
     - email (String): The user's email address, unique across the system.
     - password (String): The user's hashed password.
     - first_name (String): The user's first name.
-    - interactions (relationship): A list of interactions (likes/dislikes) associated with the user.
+    - interactions (relationship): A list of interactions (likes/dislikes) associated with the user,
+      deleted by the database (ON DELETE CASCADE) along with the user.
 
     The __repr__ method provides a simple representation of the user.
     """
@@ -43,7 +46,8 @@ class User(BaseModel, UserMixin):
     email = db.Column(db.String(30), unique=True, nullable=False)
     password = db.Column(db.String(128), nullable=False)
     first_name = db.Column(db.String(20), nullable=False)
-    interactions = db.relationship('UserInteraction', backref='user', lazy=True)
+    interactions = db.relationship('UserInteraction', back_populates='user', lazy='select',
+                                   cascade='all, delete-orphan', passive_deletes=True)
 
 
     def __repr__(self):
@@ -83,7 +87,7 @@ class Car(BaseModel):
     monthly_payment = db.Column(db.Float, nullable=False)
     mileage = db.Column(db.Integer, nullable=False)
     like_count = db.Column(db.Integer, default=2, nullable=False)
-    interactions = db.relationship('UserInteraction', backref='car', lazy=True)
+    interactions = db.relationship('UserInteraction', back_populates='car', lazy='select')
 
 
     def __repr__(self):
@@ -97,9 +101,9 @@ class Car(BaseModel):
         Dictionary: A simplified view of the car's details, including ID, image URL, and name.
         """
         return {
-            'carID': int(str(self.id)),
-            'imageUrl': f'{self.image}',
-            'carName': f'{self.car_name}'
+            'carID': self.id,
+            'imageUrl': self.image,
+            'carName': self.car_name
         }
 
     def card_info(self):
@@ -111,16 +115,8 @@ class Car(BaseModel):
         Returns:
         Dictionary: A detailed view of the car's information for card display.
         """
-        width = 20
-        return {
-            'carID': int(str(self.id)),
-            'imageUrl': f'{self.image}',
-            'carName': f'{self.car_name}'.center(width),
-            'details': f'Price: £{self.monthly_payment}pm'.ljust(width) +
-                       f' Body: {self.body_type}'.rjust(width) + '\n' +
-                       f'Horsepower: {self.horsepower}bhp'.ljust(width) +
-                       f' Make: {self.make}'.rjust(width)
-        }
+        return format_card_info(self.id, self.image, self.car_name, self.monthly_payment,
+                                self.body_type, self.horsepower, self.make)
 
     def full_details(self):
         """
@@ -131,17 +127,63 @@ class Car(BaseModel):
         Returns:
         Dictionary: A comprehensive view of the car's information, including all relevant details.
         """
-        return {
-            'imageUrl': f'{self.image}',
-            'carName': f'{self.car_name}',
-            'make': f'{self.make}',
-            'model': f'{self.model}',
-            'year': f'{self.year}',
-            'body_type': f'{self.body_type}',
-            'horsepower': f'{self.horsepower}',
-            'monthly_payment': f'{self.monthly_payment}',
-            'mileage': f'{self.mileage}'
-        }
+        return format_full_details(self.image, self.car_name, self.make, self.model, self.year,
+                                   self.body_type, self.horsepower, self.monthly_payment, self.mileage)
+
+
+# Columns feeding format_card_info, in argument order; lets views build cards from plain rows
+CARD_INFO_COLUMNS = (Car.id, Car.image, Car.car_name, Car.monthly_payment,
+                     Car.body_type, Car.horsepower, Car.make)
+
+# Card layout: the name is centred over two 20-character columns of details
+CARD_NAME_FORMAT = '{:^20}'.format
+CARD_DETAILS_FORMAT = '{:<20}{:>20}\n{:<20}{:>20}'.format
+
+
+# Car payloads are memoised on the field values they are built from, so an edited
+# car simply misses the cache. The returned dictionaries are shared: treat as read-only.
+@functools.lru_cache(maxsize=4096)
+def format_card_info(car_id, image, car_name, monthly_payment, body_type, horsepower, make):
+    """
+    Builds the card display payload for a car from its field values.
+
+    Parameters:
+    The Car column values shown on the card, as passed by Car.card_info.
+
+    Returns:
+    Dictionary: The car's ID, image URL, centred name, and formatted details.
+    """
+    return {
+        'carID': car_id,
+        'imageUrl': image,
+        'carName': CARD_NAME_FORMAT(car_name),
+        'details': CARD_DETAILS_FORMAT(f'Price: £{monthly_payment}pm', f' Body: {body_type}',
+                                       f'Horsepower: {horsepower}bhp', f' Make: {make}')
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def format_full_details(image, car_name, make, model, year, body_type, horsepower, monthly_payment, mileage):
+    """
+    Builds the detailed view payload for a car from its field values.
+
+    Parameters:
+    The Car column values shown in the detailed view, as passed by Car.full_details.
+
+    Returns:
+    Dictionary: The car's details, formatted as strings for display.
+    """
+    return {
+        'imageUrl': image,
+        'carName': car_name,
+        'make': make,
+        'model': model,
+        'year': str(year),
+        'body_type': body_type,
+        'horsepower': str(horsepower),
+        'monthly_payment': str(monthly_payment),
+        'mileage': str(mileage)
+    }
 
 
 class UserInteraction(BaseModel):
@@ -155,15 +197,28 @@ class UserInteraction(BaseModel):
     - car_id (Integer): Foreign key linking to the Car model.
     - swiped_right (Boolean): Represents if the user liked (True) or disliked (False) the car.
     - timestamp (DateTime): The timestamp when the interaction occurred.
+    - user (relationship): The user who made the interaction, batch-loaded with the interaction.
+    - car (relationship): The car that was interacted with, batch-loaded with the interaction.
+
+    Composite indexes cover the per-user lookups made by the views:
+    - ix_ui_user_car: interactions of a user with a given car (explore, react).
+    - ix_ui_user_swipe: a user's likes or dislikes, carrying car_id so the saved
+      join is served from the index alone.
 
     The __repr__ method provides a simple representation of the user interaction.
     """
     __tablename__ = 'user_interactions'
+    __table_args__ = (
+        db.Index('ix_ui_user_car', 'user_id', 'car_id'),
+        db.Index('ix_ui_user_swipe', 'user_id', 'swiped_right', 'car_id'),
+    )
 
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
     car_id = db.Column(db.Integer, db.ForeignKey('cars.id'), nullable=False)
     swiped_right = db.Column(db.Boolean, nullable=False)
-    timestamp = db.Column(db.DateTime(timezone=True), default=DT)
+    timestamp = db.Column(db.DateTime(timezone=True), default=func.now(), server_default=func.now())
+    user = db.relationship('User', back_populates='interactions', lazy='selectin')
+    car = db.relationship('Car', back_populates='interactions', lazy='selectin')
 
     def __repr__(self):
         return f"UserInteraction {self.id}: User {self.user_id}, Car {self.car_id}, Liked: {self.swiped_right}"
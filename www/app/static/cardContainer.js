@@ -61,9 +61,10 @@ function cardsEmpty() {
       },
       body: JSON.stringify({ isEmpty: true })
     })
-    .then(response => response.json())
-    .then(data =>{
-      console.log(data);
+    .then(response => {
+      if (!response.ok) {
+        throw new Error(`Cards depleted signal rejected: ${response.status}`);
+      }
       document.getElementById('no-more-cards-message').style.display = 'block';
     })
     .catch(error => console.error('Error:', error));
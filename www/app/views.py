@@ -1,21 +1,39 @@
 from flask import Blueprint, render_template, flash, redirect, url_for, request, jsonify, session
 from flask_login import login_required, logout_user, current_user
-from .models import User, Car, UserInteraction
-from app import app, db, admin
-from flask_admin.contrib.sqla import ModelView
+from .models import Car, UserInteraction, CARD_INFO_COLUMNS, format_card_info
+from .auth_service import forget_cached_user
+from app import app, db
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import IntegrityError
 import json
 from random import randint as r
 
-# Adding models to the admin view for easy management
-admin.add_view(ModelView(User, db.session))
-admin.add_view(ModelView(Car, db.session))
-admin.add_view(ModelView(UserInteraction, db.session))
-
 # Constants for message categories
 DANGER, SUCCESS = 'danger', 'success'
 views = Blueprint('views', __name__)
 
+# Catalogue of cars seeded into an empty Car table; like counts are randomised per seed
+SEED_CARS = (
+    {'image': 'astonMartinSILagonda1', 'car_name': 'Aston Martin Lagonda Series 1', 'make': 'Aston Martin', 'model': 'Lagonda', 'year': 1974,
+     'body_type': '4-door saloon', 'horsepower': 280, 'monthly_payment': 4611.96, 'mileage': 18324},
+    {'image': 'astonMartinSIIILagonda3', 'car_name': 'Aston Martin Lagonda Series 3', 'make': 'Aston Martin', 'model': 'Lagonda', 'year': 1986,
+     'body_type': '4-door saloon', 'horsepower': 230, 'monthly_payment': 7766.58, 'mileage': 132084},
+    {'image': 'astonMartinSIVLagonda4', 'car_name': 'Aston Martin Lagonda Series 4', 'make': 'Aston Martin', 'model': 'Lagonda', 'year': 1987,
+     'body_type': '4-door saloon', 'horsepower': 240, 'monthly_payment': 3633.98, 'mileage': 123117},
+    {'image': 'ferrariTestarossa1', 'car_name': 'Ferrari Testarossa', 'make': 'Ferrari', 'model': 'Testarossa', 'year': 1984,
+     'body_type': '2-door berlinetta', 'horsepower': 385, 'monthly_payment': 4185.91, 'mileage': 146545},
+    {'image': 'ferrariF512TR3', 'car_name': 'Ferrari F512 TR', 'make': 'Ferrari', 'model': '512 TR', 'year': 1991,
+     'body_type': '2-door berlinetta', 'horsepower': 422, 'monthly_payment': 3245.32, 'mileage': 198978},
+    {'image': 'ferrari308GTRainbow4', 'car_name': 'Ferrari 308 GT Bertone Rainbow', 'make': 'Ferrari', 'model': '308 GT', 'year': 1976,
+     'body_type': '2-door coupe', 'horsepower': 255, 'monthly_payment': 5585.91, 'mileage': 89017},
+    {'image': 'countachLP400Lamborghini1', 'car_name': 'Lamborghini Countach LP400', 'make': 'Lamborghini', 'model': 'LP400', 'year': 1974,
+     'body_type': '2-door coupe', 'horsepower': 375, 'monthly_payment': 8042.47, 'mileage': 167228},
+    {'image': 'countachLP5000LamborghiniQuattrovalvole3', 'car_name': 'Lamborghini Countach Quattrovalvole', 'make': 'Lamborghini', 'model': 'LP5000', 'year': 1985,
+     'body_type': '2-door coupe', 'horsepower': 455, 'monthly_payment': 8930.27, 'mileage': 103074},
+    {'image': 'countach25thAnniversaryLamborghini4', 'car_name': 'Lamborghini Countach 25th Anniversary', 'make': 'Lamborghini', 'model': '25th Anniversary', 'year': 1988,
+     'body_type': '2-door coupe', 'horsepower': 414, 'monthly_payment': 6409.78, 'mileage': 140320},
+)
+
 
 def is_table_empty(model):
     """
@@ -27,25 +45,8 @@ def is_table_empty(model):
     Returns:
     bool: True if the table is empty, False otherwise.
     """
-    return db.session.query(model).count() == 0
-
-
-def delete_user_interactions(user_id):
-    """
-    Deletes all interaction entries for a specific user.
-
-    Parameters:
-    user_id: ID of the user whose interaction entries are to be deleted.
-    """
-    try:
-        to_delete = UserInteraction.query.filter_by(user_id=user_id)
-        if to_delete.count() > 0:
-            to_delete.delete()
-            db.session.commit()
-    except Exception as e:
-        db.session.rollback()
-        print(
-            f"An error occurred while deleting interactions for user ID {user_id}: {e}")
+    # Probe for a single row rather than counting the whole table
+    return db.session.scalar(select(model.id).limit(1)) is None
 
 
 def pre_populate_tblCars():
@@ -54,34 +55,14 @@ def pre_populate_tblCars():
 
     This function checks if the Car table is empty and, if so, adds a predefined list of cars to the database.
     """
-    # random.randint -> r(1, 100)
     if is_table_empty(Car):
         try:
-            # Car instances to be added
-            cars_to_add = [
-                Car(image='astonMartinSILagonda1', car_name='Aston Martin Lagonda Series 1', make='Aston Martin', model='Lagonda',
-                    year=1974, body_type='4-door saloon', horsepower=280, monthly_payment=4611.96, mileage=18324, like_count=r(1, 100)),
-                Car(image='astonMartinSIIILagonda3', car_name='Aston Martin Lagonda Series 3', make='Aston Martin', model='Lagonda',
-                    year=1986, body_type='4-door saloon', horsepower=230, monthly_payment=7766.58, mileage=132084, like_count=r(1, 100)),
-                Car(image='astonMartinSIVLagonda4', car_name='Aston Martin Lagonda Series 4', make='Aston Martin', model='Lagonda',
-                    year=1987, body_type='4-door saloon', horsepower=240, monthly_payment=3633.98, mileage=123117, like_count=r(1, 100)),
-                Car(image='ferrariTestarossa1', car_name='Ferrari Testarossa', make='Ferrari', model='Testarossa',
-                    year=1984, body_type='2-door berlinetta', horsepower=385, monthly_payment=4185.91, mileage=146545, like_count=r(1, 100)),
-                Car(image='ferrariF512TR3', car_name='Ferrari F512 TR', make='Ferrari', model='512 TR',
-                    year=1991, body_type='2-door berlinetta', horsepower=422, monthly_payment=3245.32, mileage=198978, like_count=r(1, 100)),
-                Car(image='ferrari308GTRainbow4', car_name='Ferrari 308 GT Bertone Rainbow', make='Ferrari', model='308 GT',
-                    year=1976, body_type='2-door coupe', horsepower=255, monthly_payment=5585.91, mileage=89017, like_count=r(1, 100)),
-                Car(image='countachLP400Lamborghini1', car_name='Lamborghini Countach LP400', make='Lamborghini', model='LP400',
-                    year=1974, body_type='2-door coupe', horsepower=375, monthly_payment=8042.47, mileage=167228, like_count=r(1, 100)),
-                Car(image='countachLP5000LamborghiniQuattrovalvole3', car_name='Lamborghini Countach Quattrovalvole', make='Lamborghini', 
-                    model='LP5000', year=1985, body_type='2-door coupe', horsepower=455, monthly_payment=8930.27, mileage=103074, like_count=r(1, 100)),
-                Car(image='countach25thAnniversaryLamborghini4', car_name='Lamborghini Countach 25th Anniversary', make='Lamborghini', 
-                    model='25th Anniversary', year=1988, body_type='2-door coupe', horsepower=414, monthly_payment=6409.78, mileage=140320, like_count=r(1, 100))
-            ]
-            db.session.add_all(cars_to_add)
+            # Seed rows with a random like count, inserted with a single executemany INSERT
+            cars_to_add = [{**car, 'like_count': r(1, 100)} for car in SEED_CARS]
+            db.session.execute(insert(Car), cars_to_add)
             db.session.commit()
             return jsonify({"status": "success", "message": "Cars added successfully"})
-        except IntegrityError:
+        except IntegrityError as e:
             db.session.rollback()
             return jsonify({"status": "error", "message": str(e)}), 500
 
@@ -112,21 +93,26 @@ def toggle_count(car_id):
     Returns:
     JSON response: Contains the updated like count of the car.
     """
-    car = db.session.get(Car, car_id)
-    if not car:
-        return jsonify({"error": "Car not found"}), 404
-
     liked = request.json.get('liked')
 
     # Check if liked is not a boolean
     if liked not in [True, False]:
         return jsonify({"error": "Invalid liked value"}), 400
 
-    car.like_count += 1 if liked else -1
-    
+    # Adjust the count in a single atomic UPDATE so concurrent likes are not lost
+    like_count = db.session.scalar(
+        update(Car)
+        .where(Car.id == car_id)
+        .values(like_count=Car.like_count + (1 if liked else -1))
+        .returning(Car.like_count)
+    )
+    if like_count is None:
+        db.session.rollback()
+        return jsonify({"error": "Car not found"}), 404
+
     db.session.commit()
 
-    return jsonify(like_count=car.like_count)
+    return jsonify(like_count=like_count)
 
 
 @app.route('/react', methods=['POST'])
@@ -176,17 +162,15 @@ def cards_depleted():
     Receives a signal indicating that all cards have been swiped.
 
     Returns:
-    JSON response: Confirmation message indicating no more cards are available.
+    Empty response: 204 No Content when the signal is understood, 400 Bad Request otherwise.
     """
     data = request.get_json()
 
-    if data and data.get('isEmpty'):
-        return jsonify({"message": "No more cards available"})
-    
-    elif data and not data.get('isEmpty'): #
-        return jsonify({"message": "Cards still available"})
-    
-    return jsonify({"error": "Invalid request"}), 400
+    # Depleted or not, the client only needs the status code as acknowledgement
+    if data:
+        return '', 204
+
+    return '', 400
 
 
 @views.route('/')
@@ -221,17 +205,16 @@ def explore():
     Returns:
     Rendered HTML: The explore page with a list of cars for the user to interact with.
     """
-    # Retrieve IDs of cars the user has interacted with
-    interacted_car_ids = UserInteraction.query.with_entities(
-        UserInteraction.car_id
-    ).filter_by(user_id=current_user.id).all()
+    # Cars the user has already liked or disliked, correlated to the outer Car row
+    interacted = select(UserInteraction.id).where(
+        UserInteraction.user_id == current_user.id,
+        UserInteraction.car_id == Car.id
+    ).exists()
 
-    # Convert list of tuples to a list of IDs
-    interacted_car_ids = [car_id for (car_id,) in interacted_car_ids]
-
-    # Fetch cars not yet interacted with by the user
-    cars_to_swipe = Car.query.filter(Car.id.notin_(interacted_car_ids)).all()
-    cars_remaining = [car.card_info() for car in cars_to_swipe]
+    # Fetch card columns of cars not yet interacted with by the user as plain rows,
+    # skipping ORM instance construction
+    rows = db.session.execute(select(*CARD_INFO_COLUMNS).where(~interacted)).all()
+    cars_remaining = [format_card_info(*row) for row in rows]
 
     cars_remain = bool(cars_remaining)
 
@@ -251,20 +234,18 @@ def saved():
     Returns:
     Rendered HTML: The saved page with a list of liked cars.
     """
-    # Fetch liked interactions for the current user
-    liked_interactions = UserInteraction.query.filter_by(
-        user_id=current_user.id, swiped_right=True
+    # Fetch the cars liked by the current user in a single joined query
+    cars = db.session.scalars(
+        select(Car)
+        .join(UserInteraction, UserInteraction.car_id == Car.id)
+        .where(UserInteraction.user_id == current_user.id,
+               UserInteraction.swiped_right.is_(True))
     ).all()
 
-    # Compile details of liked cars
-    liked_cars = [db.session.get(Car, interaction.car_id).grid_view(
-    ) for interaction in liked_interactions if db.session.get(Car, interaction.car_id)]
-    
-    liked_exist = bool(liked_cars)
+    # Compile details of liked cars, including their like counts, in one pass
+    liked_cars = [{**car.grid_view(), 'like_count': car.like_count} for car in cars]
 
-    # Pass in like_count of each car
-    for car in liked_cars:
-        car['like_count'] = db.session.get(Car, car['carID']).like_count
+    liked_exist = bool(liked_cars)
 
     return render_template('/site/saved.html', title='Saved',
                            liked_exist=liked_exist, liked_cars=liked_cars, user=current_user)
@@ -319,17 +300,17 @@ def delete_account():
     Redirection to the login page after successful deletion, or an error message if the user is not authenticated.
     """
     if current_user.is_authenticated:
-        # Fetch current user from the database
-        user = db.session.get(User, current_user.id)
-        
-        # Delete user interactions
-        delete_user_interactions(current_user.id)
-        if user:
-            db.session.delete(user)  # Delete the user
-            db.session.commit()
-            flash('Your account has successfully been deleted.', category=SUCCESS)
-        else:
-            flash('User not found.', category=DANGER)
+        # The login manager has already loaded the user for this request
+        user = current_user._get_current_object()
+        user_id = user.id
+
+        # Delete the user's interactions with a single bulk DELETE, then the user, in one
+        # transaction; databases created before ON DELETE CASCADE don't remove them
+        db.session.execute(delete(UserInteraction).where(UserInteraction.user_id == user_id))
+        db.session.delete(user)
+        db.session.commit()
+        forget_cached_user(user_id)
+        flash('Your account has successfully been deleted.', category=SUCCESS)
         logout_user()  # Logout the user
         session['login_attempts'] = 0  # Reset login attempts
         return redirect(url_for('auth.login'))
@@ -1,4 +1,5 @@
 import os
+from sqlalchemy.pool import StaticPool
 
 # Determine the base directory of the application
 basedir = os.path.abspath(os.path.dirname(__file__))
@@ -13,11 +14,17 @@ class Config(object):
     - SQLALCHEMY_DATABASE_URI (str): Database connection string.
     - SQLALCHEMY_TRACK_MODIFICATIONS (bool): Flag to track modifications of objects and emit signals.
     - WTF_CSRF_ENABLED (bool): Flag to enable/disable CSRF protection in forms.
+    - REDIS_URL (str): Redis connection string; when set, sessions are stored server-side in Redis.
+    - ARGON2_TIME_COST (int): Number of Argon2 passes when hashing a password.
+    - ARGON2_MEMORY_COST (int): Argon2 memory use in KiB when hashing a password.
     """
     SECRET_KEY = os.environ.get('SECRET_KEY', 'default-fallback-secret-key')
     SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(basedir, 'app.db')
-    SQLALCHEMY_TRACK_MODIFICATIONS = True
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
     WTF_CSRF_ENABLED = True
+    REDIS_URL = os.environ.get('REDIS_URL')
+    ARGON2_TIME_COST = 2
+    ARGON2_MEMORY_COST = 19456
 
 
 class DevelopmentConfig(Config):
@@ -48,3 +55,24 @@ class ProductionConfig(Config):
     PORT = 131
     DEBUG = False
     # Other production-specific settings can be added here
+
+
+class TestingConfig(Config):
+    """
+    Testing-specific configuration class.
+
+    Inherits from the base Config class and points the app at a private in-memory database.
+
+    Attributes:
+    - TESTING (bool): Enables Flask's testing mode.
+    - SQLALCHEMY_DATABASE_URI (str): In-memory SQLite database, so tests never touch app.db.
+    - SQLALCHEMY_ENGINE_OPTIONS (dict): Shares one connection so every session sees the same in-memory database.
+    - WTF_CSRF_ENABLED (bool): Disabled so tests can post forms without a CSRF token.
+    - ARGON2_TIME_COST, ARGON2_MEMORY_COST (int): Argon2's minimum cost, as test passwords need no protection.
+    """
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_ENGINE_OPTIONS = {'poolclass': StaticPool, 'connect_args': {'check_same_thread': False}}
+    WTF_CSRF_ENABLED = False
+    ARGON2_TIME_COST = 1
+    ARGON2_MEMORY_COST = 8
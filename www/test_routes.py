@@ -0,0 +1,1198 @@
+import json
+import os
+
+# The engine is created when the app is imported, so select the test configuration first
+os.environ['APP_CONFIG'] = 'TestingConfig'
+
+import pytest
+from unittest.mock import patch
+from werkzeug.security import generate_password_hash
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+from app import app, db
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from app.forms import LoginForm, RegistrationForm
+from app.models import User, Car, UserInteraction
+from app.auth import MAX_LOGIN_ATTEMPTS, login_attempts_key
+from app.auth_service import (CREDENTIAL_CACHE, PASSWORD_HASHER, forget_cached_user, generate_hash,
+                              load_cached_user, user_cache_key, verify_password)
+from app.views import pre_populate_tblCars
+
+# Details of test user 1, fixed when create_test_data inserts it
+USER1_EMAIL = 'user1@example.com'
+USER1_FIRST_NAME = 'User1'
+
+# Password hashes of the test users, computed once since hashing is deliberately slow
+USER1_PASSWORD_HASH = generate_hash('Password1')
+USER2_PASSWORD_HASH = generate_hash('password2')
+
+# Routes that redirect guests to the login page, and a route that doesn't exist
+GUEST_ROUTES = ('/explore', '/saved', '/settings')
+MISSING_ROUTE = '/this-route-does-not-exist'
+
+# WSGI environs of the read-only guest requests, built once for the module
+GUEST_ENVIRONS = {
+    route: EnvironBuilder(path=route).get_environ()
+    for route in (*GUEST_ROUTES, MISSING_ROUTE)
+}
+
+# Serialised body of a valid like reaction to car 1, encoded once for the module
+REACT_BODY = json.dumps({'carID': 1, 'swiped_right': True}).encode()
+
+
+class ConnectionSession(Session):
+    """
+    Session that always uses the connection it was bound to.
+
+    Flask-SQLAlchemy's session picks the app's engine itself, which would bypass the
+    per-test transaction.
+    """
+    def get_bind(self, *args, **kwargs):
+        return self.bind
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the few Redis commands the app uses.
+
+    Expiry times are accepted but not enforced.
+    """
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+    def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+    def expire(self, key, ttl):
+        return key in self.store
+
+    def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """
+    Queues commands for a FakeRedis and runs them all on execute().
+    """
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self.client, name)
+        return lambda *args: self.commands.append((command, args))
+
+    def execute(self):
+        return [command(*args) for command, args in self.commands]
+
+
+def get_as_guest(route):
+    """
+    Sends a cookieless GET request for the route straight to the WSGI app,
+    skipping the test client's per-request environ building and cookie handling
+
+    :return: tuple of the status code, response headers and response body
+    """
+    # The app stores the request in the environ it is given, so pass it a copy
+    app_iter, status, headers = run_wsgi_app(app, dict(GUEST_ENVIRONS[route]))
+    try:
+        body = b''.join(app_iter)
+    finally:
+        if hasattr(app_iter, 'close'):
+            app_iter.close()
+
+    return int(status.split(' ', 1)[0]), headers, body
+
+
+def create_test_data():
+    """
+    Creates test data shared by every unit test in the module
+
+    :return: None
+    """
+    # Insert all the test data in a single transaction, committed when the block exits
+    with db.session.begin():
+        # Create users, inserted with a single executemany INSERT
+        user1_id, user2_id = db.session.scalars(
+            insert(User).returning(User.id, sort_by_parameter_order=True), [
+                {'email': USER1_EMAIL, 'first_name': USER1_FIRST_NAME,
+                 'password': USER1_PASSWORD_HASH},
+                {'email': 'user2@example.com', 'first_name': 'User2',
+                 'password': USER2_PASSWORD_HASH},
+            ]).all()
+
+        # Create cars, inserted with a single executemany INSERT
+        car1_id, car2_id, car3_id = db.session.scalars(
+            insert(Car).returning(Car.id, sort_by_parameter_order=True), [
+                {'image': 'ferrariF512TR3', 'car_name': 'Ferrari F512 TR', 'make': 'Ferrari',
+                 'model': 'F512 TR', 'year': 1991, 'body_type': '2-door berlinetta', 'horsepower': 422,
+                 'monthly_payment': 3245.32, 'mileage': 198978, 'like_count': 11},
+                {'image': 'astonMartinSILagonda1', 'car_name': 'Aston Martin Lagonda Series 1',
+                 'make': 'Aston Martin', 'model': 'Lagonda', 'year': 1974, 'body_type': '4-door saloon',
+                 'horsepower': 280, 'monthly_payment': 4611.96, 'mileage': 18324, 'like_count': 14},
+                {'image': 'countachLP400Lamborghini1', 'car_name': 'Lamborghini Countach LP400',
+                 'make': 'Lamborghini', 'model': 'LP400', 'year': 1974, 'body_type': '2-door coupe',
+                 'horsepower': 375, 'monthly_payment': 8042.47, 'mileage': 167228, 'like_count': 86},
+            ]).all()
+
+        # User interactions, inserted with a single executemany INSERT
+        #   User 1 likes Car 1 & 2, dislikes Car 3
+        #   User 2 has not interacted with any cars
+        db.session.execute(insert(UserInteraction), [
+            {'user_id': user1_id, 'car_id': car1_id, 'swiped_right': True},
+            {'user_id': user1_id, 'car_id': car2_id, 'swiped_right': True},
+            {'user_id': user1_id, 'car_id': car3_id, 'swiped_right': False},
+        ])
+
+
+@pytest.fixture(scope='module', autouse=True)
+def database():
+    """
+    Creates the schema and test data in the in-memory database once for the module,
+    dropping the schema once every test in it has run
+
+    :return: None
+    """
+    with app.app_context():
+        db.create_all()
+
+        # The fixture session is discarded afterwards, so skip reloading and flush checks
+        fixture_session = db.session()
+        fixture_session.expire_on_commit = False
+        fixture_session.autoflush = False
+        create_test_data()
+
+    yield
+
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture(autouse=True)
+def transaction(database):
+    """
+    Runs the unit test inside a transaction, rolled back afterwards to restore the test data
+
+    The test's session joins the transaction through savepoints, so commits made by
+    the app only release a savepoint.
+
+    :return: None
+    """
+    # One app context for the whole test, so the test bodies don't each push their own
+    app_context = app.app_context()
+    app_context.push()
+
+    connection = db.engine.connect()
+    outer_transaction = connection.begin()
+    # pysqlite only emits BEGIN ahead of DML, so start the outer transaction explicitly
+    connection.exec_driver_sql('BEGIN')
+
+    app_session = db.session
+    db.session = db._make_scoped_session({
+        'class_': ConnectionSession,
+        'bind': connection,
+        'join_transaction_mode': 'create_savepoint',
+    })
+
+    yield
+
+    app_context.pop()
+    db.session = app_session
+    outer_transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def client():
+    """
+    Provides a Flask test client with its own cookie jar for the unit test
+
+    :return: FlaskClient
+    """
+    return app.test_client()
+
+
+@pytest.fixture(scope='module')
+def login_cookie(database):
+    """
+    Logs in test user 1 once for the module and keeps the resulting session cookie
+
+    :return: str
+    """
+    login_client = app.test_client()
+    user_data = {'email': USER1_EMAIL, 'password': 'Password1'}
+    # Follow the redirect so the sign-in flash message is consumed, not carried into every test
+    response = login_client.post('/login', data=user_data, follow_redirects=True)
+    assert response.status_code == 200
+
+    return login_client.get_cookie(app.config['SESSION_COOKIE_NAME']).value
+
+
+@pytest.fixture
+def auth_client(login_cookie):
+    """
+    Provides a Flask test client already logged in as test user 1
+
+    Each test gets its own client carrying a copy of the module's login cookie, so a
+    test that logs out or deletes the account doesn't sign out the others.
+
+    :return: FlaskClient
+    """
+    auth_client = app.test_client()
+    auth_client.set_cookie(app.config['SESSION_COOKIE_NAME'], login_cookie)
+    return auth_client
+
+
+@pytest.fixture
+def fake_redis():
+    """
+    Points the app's Redis users at an in-memory FakeRedis for the unit test
+
+    :return: FakeRedis
+    """
+    fake_redis = FakeRedis()
+    with patch('app.auth.redis_client', fake_redis), \
+            patch('app.auth_service.redis_client', fake_redis):
+        yield fake_redis
+
+
+# Authentication tests
+def test_route_user_login(client):
+    """
+    Logs in the test user using valid credentials
+
+    Testing for:
+    - Successful login
+    - Successful login flash message
+    """
+    with client:
+        # Login the test user
+        user_data = {'email': USER1_EMAIL, 'password': 'Password1'}
+        login_response = client.post('/login', data=user_data, follow_redirects=True)
+
+        # Check if login was successful
+        assert login_response.status_code == 200
+        body = login_response.data
+        assert b'Home' in body
+        assert b'Signed in successfully!' in body
+
+
+def test_legacy_password_login(client):
+    """
+    Logs in a user whose password hash comes from the previous Werkzeug PBKDF2 scheme
+
+    Testing for:
+    - Unsuccessful login with a wrong password, leaving the hash untouched
+    - Successful login with the right password
+    - Password re-hashed with Argon2id after the successful login
+    """
+    # Same format as the old Werkzeug hashes, with few iterations to keep the test fast
+    legacy_hash = generate_password_hash('Legacy123', method='pbkdf2:sha256:1000')
+    db.session.execute(insert(User).values(
+        email='legacy@example.com', first_name='Legacy', password=legacy_hash))
+    stored_hash = select(User.password).filter_by(email='legacy@example.com')
+
+    # A wrong password is rejected
+    response = client.post('/login', data={'email': 'legacy@example.com', 'password': 'Wrong123'})
+    assert response.status_code == 200
+    assert b'Incorrect email or password, try again.' in response.data
+    assert db.session.scalar(stored_hash) == legacy_hash
+
+    # The right password signs in and upgrades the stored hash
+    response = client.post('/login', data={'email': 'legacy@example.com', 'password': 'Legacy123'})
+    assert response.status_code == 302
+    assert response.location == '/'
+    assert db.session.scalar(stored_hash).startswith('$argon2id$')
+
+
+def test_credential_cache():
+    """
+    Tests the cache of recently verified credentials
+
+    Testing for:
+    - Repeat verification served from the cache without hashing
+    - Wrong password not served from the cache
+    - Cache entry ignored once the stored hash changes
+    """
+    CREDENTIAL_CACHE.clear()
+    user1 = db.session.get(User, 1)
+    assert verify_password(user1, 'Password1')
+
+    # The repeat verification is a cache hit
+    with patch('app.auth_service.PASSWORD_HASHER', wraps=PASSWORD_HASHER) as mock_hasher:
+        mock_verify = mock_hasher.verify
+        assert verify_password(user1, 'Password1')
+        mock_verify.assert_not_called()
+
+        # A wrong password misses the cache and fails the hash check
+        assert not verify_password(user1, 'Password2')
+        mock_verify.assert_called_once()
+
+        # A new stored hash (e.g. after a password change) invalidates the entry
+        mock_verify.reset_mock()
+        user1.password = generate_hash('Password1')
+        assert verify_password(user1, 'Password1')
+        mock_verify.assert_called_once()
+
+
+def test_route_user_login_fail(client):
+    """
+    Logs in the test user using invalid credentials
+
+    Testing for:
+    - Unsuccessful login
+    - Unsuccessful login flash message
+    """
+    with client:
+        # Login the test user with a well-formed but wrong password
+        user_data = {'email': USER1_EMAIL, 'password': 'Wrong123'}
+        login_response = client.post(
+            '/login', data=user_data, follow_redirects=False)
+
+        # Check if login was unsuccessful
+        assert login_response.status_code == 200
+        assert b'Incorrect email or password, try again.' in login_response.data
+
+
+def test_route_user_signup(client):
+    """
+    Signs up the test user using valid credentials
+
+    Testing for:
+    - Successful signup
+    - Successful signup flash message
+    """
+    valid_data = {
+        'email': 'new@example.com',
+        'first_name': 'New',
+        'password': 'Newpassword1',
+        'confirm_password': 'Newpassword1'
+    }
+
+    # Test registration with valid data
+    response = client.post('/signup',
+                             data=valid_data, follow_redirects=True)
+    assert response.status_code == 200
+    assert b"Account created!" in response.data
+
+
+def test_route_user_signup_fail(client):
+    """
+    Signs up the test user using invalid credentials
+
+    Testing for:
+    - Unsuccessful signup
+    - Unsuccessful signup flash message
+    """
+    invalid_data = {
+        'email': 'new@example.com',
+        'first_name': 'New',
+        'password': None,
+        'confirm_password': 'Newpassword1'
+    }
+
+    # Test registration with invalid data
+    response = client.post('/signup', data=invalid_data)
+    assert b"Sign Up" in response.data
+
+
+def test_route_user_logout(auth_client):
+    """
+    Logs out the test user
+
+    Testing for:
+    - Successful logout
+    - Successful logout flash message
+    """
+    # Log out the test user, landing back on the home page
+    response = auth_client.get('/logout', follow_redirects=True)
+    assert response.status_code == 200
+
+    # Check if logout was successful
+    assert b'Signed out successfully!' in response.data
+    assert b'Welcome to AutoSwipe, Guest.' in response.data
+
+
+
+#   Form tests
+def test_login_form_validation():
+    """
+    Form validation tests for the login form
+
+    Testing for:
+    - Valid input
+    - Invalid email
+    - Invalid password (empty)
+    """
+    # Base valid data
+    base_data = {'email': 'user@example.com',
+                 'password': 'ValidPass123'}
+
+    # Test valid input
+    form = LoginForm(data=base_data)
+    assert form.validate()
+
+    # Invalid cases as overrides of the valid data
+    invalid_cases = [
+        {'email': 'invalid-email'},  # Invalid email
+        {'password': ''},            # Invalid (empty) password
+    ]
+    for override in invalid_cases:
+        form = LoginForm(data={**base_data, **override})
+        assert not form.validate(), override
+
+
+def test_registration_form_validation():
+    """
+    Form validation tests for the registration form
+
+    Testing for:
+    - Valid input
+    - Invalid (mismatch) password
+    - Invalid (too long) password
+    - Invalid (missing num/chars) password
+    - Invalid first name (contains numbers)
+    - Invalid first name (empty)
+    """
+    # Base valid data
+    base_data = {
+        'email': 'newUser@example.com',
+        'first_name': 'NewUser',
+        'password': 'ValidPass123',
+        'confirm_password': 'ValidPass123'
+    }
+
+    # Test valid input
+    form = RegistrationForm(data=base_data)
+    assert form.validate()
+
+    # Invalid cases as overrides of the valid data
+    invalid_cases = [
+        {'confirm_password': 'DifferentPass123'},  # Invalid (mismatch) password
+        {'password': f"{'.' * 19}"},               # Invalid (too long) password
+        {'password': 'weakpassword'},              # Invalid (missing num/chars) password
+        {'first_name': 'NewUser1'},                # Invalid first name (contains numbers)
+        {'first_name': ''},                        # Invalid first name (empty)
+    ]
+    for override in invalid_cases:
+        form = RegistrationForm(data={**base_data, **override})
+        assert not form.validate(), override
+
+
+
+# Model tests
+#   Creation tests
+def test_valid_car_creation():
+    """
+    Tests the existence of the test car from setup()
+    """
+    car1_id = db.session.get(Car, 1).id
+    assert car1_id is not None
+
+
+def test_invalid_car_creation():
+    """
+    Creates an invalid car
+    
+    Testing for:
+    - Invalid car object in database
+    """
+    car = Car(make='', model='', year=1900, like_count=0)
+    db.session.add(car)
+
+    # Flushing is enough for the NOT NULL constraints to reject the row
+    with pytest.raises(IntegrityError):
+        db.session.flush()
+
+    assert car.id is None
+
+
+def test_valid_user_creation():
+    """
+    Tests the existence of the test user from setup()
+    """
+    user1_id = db.session.get(User, 1).id
+    assert user1_id is not None
+
+
+def test_invalid_user_creation():
+    """
+    Creates an invalid user
+
+    Testing for:
+    - Invalid user object in database
+    """
+    user_id = User(email='', first_name='', password='').id
+    assert user_id is None
+
+
+def test_valid_user_interaction_creation():
+    """
+    Tests the existence of the test user interaction from setup()
+    """
+    interaction1_id = db.session.get(UserInteraction, 1).id
+    assert interaction1_id is not None
+
+
+def test_invalid_user_interaction_creation():
+    """
+    Creates an invalid user interaction
+
+    Testing for:
+    - Invalid user interaction object in database
+    """
+    interaction = UserInteraction(
+        user_id=1, car_id=3, swiped_right=None)
+    db.session.add(interaction)
+
+    # Flushing is enough for the NOT NULL constraints to reject the row
+    with pytest.raises(IntegrityError):
+        db.session.flush()
+
+    assert interaction.id is None
+
+
+#   Deletion tests
+def test_delete_user():
+    """
+    Tests the deletion of the test user 2 from setup()
+
+    Testing for:
+    - User 2 deleted from database
+    - User 2 no longer exists in database
+    """
+    # Confirm that 2 users exist to begin with
+    user_count = db.session.scalar(select(func.count(User.id)))
+    assert user_count == 2
+
+    user2 = db.session.get(User, 2)
+    assert user2 is not None
+    
+    db.session.delete(user2)
+    db.session.commit()
+
+    # Check if user 2 exists
+    new_user2 = db.session.get(User, 2)
+    assert new_user2 is None
+
+    # Double check if user 2 was deleted
+    new_user_count = db.session.scalar(select(func.count(User.id)))
+    assert new_user_count == user_count - 1
+
+
+def test_delete_user_interactions():
+    """
+    Deletes all interactions for user 1
+
+    Testing for:
+    - All interactions for user 1 deleted from database
+    - All interactions for user 1 no longer exist in database
+    """
+    # Confirm that 3 interactions exist for user 1 to begin with
+    interaction_count = db.session.scalar(
+        select(func.count(UserInteraction.id)).filter_by(user_id=1))
+    assert interaction_count == 3
+
+    # Delete interaction 3 for user 1
+    interaction3 = db.session.get(UserInteraction, 3)
+    assert interaction3 is not None
+
+    db.session.delete(interaction3)
+    db.session.commit()
+
+    # Check if interaction 3 exists
+    new_interaction3 = db.session.get(UserInteraction, 3)
+    assert new_interaction3 is None
+
+    # Double check if interaction 3 was deleted
+    new_interaction_count = db.session.scalar(
+        select(func.count(UserInteraction.id)).filter_by(user_id=1))
+    assert new_interaction_count == interaction_count - 1
+
+
+def test_delete_account_route(auth_client):
+    """
+    Tests the deletion of the test user 1 from setup() 
+        through the delete_account route
+
+    Testing for:
+    - User 1 deleted from database
+    - User 1 no longer exists in database
+    - User 1's interactions deleted along with the account
+    """
+    response = auth_client.post('/delete_account')
+    assert response.status_code == 302
+    assert response.location == '/login'
+
+    # Verify that the user is actually deleted
+    user = db.session.get(User, 1)
+    assert user is None
+
+    # Verify that none of the user's interactions are left behind
+    interaction_count = db.session.scalar(
+        select(func.count(UserInteraction.id)).filter_by(user_id=1))
+    assert interaction_count == 0
+
+
+#   Model relationship tests
+def test_valid_user_interaction_relationship():
+    """
+    Tests the relationship between user 1 and interaction 1
+
+    Testing for:
+    - User 1 and interaction 1 are related
+    - User 1 and interaction 1 are not related to user 2 or car 1
+    """
+    # Retrieve user 1 from the database
+    user1 = User.query.first()
+    assert user1 is not None, "Test user not found in database"
+
+    # Retrieve car 1 from the database
+    car1 = Car.query.first()
+    assert car1 is not None, "Test car not found in database"
+
+    # Retrieve interaction 1 from the database
+    test_interaction = UserInteraction.query.first()
+    assert test_interaction is not None, "Test interaction not found in database"
+
+    # Test the user 1 interaction relationship
+    assert test_interaction.user == user1
+
+
+def test_invalid_user_interaction_relationship():
+    """
+    Tests the relationship between user 2 and interaction 1
+
+    Testing for:
+    - User 2 and interaction 1 are not related
+    - User 2 and interaction 1 are not related to user 1 or car 1
+    """
+
+    # Retrieve user 2 from the database
+    user2 = db.session.get(User, 2)
+    assert user2 is not None, "User 2 not found in database"
+
+    # Retrieve car 1 from the database
+    car1 = db.session.get(Car, 1)
+    assert car1 is not None, "Car 1 not found in database"
+
+    # Retrieve all interactions from the database
+    interactions = UserInteraction.query.all()
+    assert interactions is not None, "No interactions found in database"
+
+    # Test the user interaction relationship
+    # This should fail because user 2 and none of the cars are related
+    # because user 2 has not interacted with any cars.
+    for interaction in interactions:
+        assert interaction.user != user2
+
+
+
+# Live-service tests
+def test_like_count_increment(client):
+    """
+    Tests the incrementation of the like count for car 1
+
+    Testing for:
+    - Like count incremented by 1
+    """
+    # Retrieve the test car from the database (entry 1)
+    car1 = Car.query.first()
+    assert car1 is not None, "Car 1 not found in database"
+
+    # Save the car ID and like count for the test
+    car1_id = car1.id
+    before_increment = car1.like_count
+
+    # Simulate the AJAX call to increment like count
+    response = client.post(
+        f'/toggle_count/{car1_id}', json={'liked': True})
+    data = response.get_json()
+    assert response.status_code == 200
+    assert data['like_count'] == before_increment + 1
+
+    # Re-query the car to get the updated like count
+    car1 = db.session.get(Car, 1)
+    assert car1.like_count == before_increment + 1
+
+
+def test_like_count_decrement(client):
+    """
+    Tests the decrementation of the like count for car 1
+
+    Testing for:
+    - Like count decremented by 1
+    """
+    # Retrieve the test car from the database
+    car1 = Car.query.first()
+    assert car1 is not None, "Car 1 not found in database"
+
+    # Save the car ID and like count for the test
+    car1_id = car1.id
+    before_decrement = car1.like_count
+
+    # Simulate the AJAX call to increment like count
+    response = client.post(
+        f'/toggle_count/{car1_id}', json={'liked': False})
+    data = response.get_json()
+    assert response.status_code == 200
+    assert data['like_count'] == before_decrement - 1
+
+    # Re-query the car to get the updated like count
+    car1 = db.session.get(Car, 1)
+    assert car1.like_count == before_decrement - 1
+
+
+def test_invalid_like_count_action(client):
+    """
+    Tests the invalidation of the like count for car 1
+
+    Testing for:
+    - Like count unchanged
+    """
+    # Retrieve the test car from the database
+    car1 = Car.query.first()
+    assert car1 is not None, "Car 1 not found in database"
+
+    # Save the car ID and like count for the test
+    car1_id = car1.id
+    before_decrement = car1.like_count
+
+    # Simulate the invalid AJAX call JSON response
+    response = client.post(
+        f'/toggle_count/{car1_id}', json={'liked': None})
+    data = response.get_json()
+    assert response.status_code == 400
+    assert next(iter(data)) != 'liked'
+
+    # Re-query the car to get the unchanged like count
+    car1 = db.session.get(Car, 1)
+    assert car1.like_count == before_decrement
+
+
+def test_cards_depleted(client):
+    """
+    Tests the cards depleted signal
+
+    Testing for:
+    - Cards depleted signal received
+    - Cards not depleted signal received
+    - Invalid cards depleted signal received
+    - Acknowledgements carry no body
+    """
+    # Simulate a valid 'cards depleted' signal
+    base_data = {'isEmpty': True}
+
+    response = client.post(
+        '/cards-depleted',
+        json=base_data
+    )
+    assert response.status_code == 204
+    assert response.data == b''
+
+    # Simulate another valid 'cards not depleted' signal
+    cards_full_data = base_data.copy()
+    cards_full_data['isEmpty'] = False
+    response = client.post(
+        '/cards-depleted',
+        json=cards_full_data
+    )
+    assert response.status_code == 204
+    assert response.data == b''
+
+    # Simulate an invalid 'cards depleted' signal
+    invalid_card_data = base_data.copy()
+    invalid_card_data.clear()
+    response = client.post(
+        '/cards-depleted',
+        json=invalid_card_data
+    )
+    assert response.status_code == 400
+    assert response.data == b''
+
+
+def test_reaction_validation(auth_client):
+    """
+    Tests the validation of the reaction data/signal
+
+    Testing for:
+    - Valid reaction data/signal
+    - Invalid reaction data/signal (empty)
+    - Invalid reaction data/signal (missing car ID)
+    - Invalid reaction data/signal (missing swiped_right)
+    """
+
+    # Valid data
+    base_data = {'carID': 1, 'swiped_right': True}
+    response = auth_client.post('/react', json=base_data)
+    assert response.status_code == 200
+    assert 'success' in response.get_json()['status']
+
+    # Invalid data (empty)
+    empty_reaction_data = base_data.copy()
+    empty_reaction_data.clear()
+    response = auth_client.post('/react', json=empty_reaction_data)
+    assert response.status_code == 400
+    assert 'Invalid car ID and swiped_right provided' in response.get_json()['status']
+
+    # Invalid data (missing car ID)
+    invalid_car_id = base_data.copy()
+    invalid_car_id['carID'] = None
+    response = auth_client.post(
+        '/react', json=invalid_car_id)
+    assert response.status_code == 400
+    assert 'Invalid car ID provided' in response.get_json()['status']
+
+    # Invalid data (missing swiped_right)
+    invalid_swipe_action = base_data.copy()
+    invalid_swipe_action['swiped_right'] = None
+    response = auth_client.post('/react', json=invalid_swipe_action)
+    assert response.status_code == 400
+    assert 'Invalid swiped_right provided' in response.get_json()['status']
+
+
+def test_successful_login_resets_attempts(client):
+    """
+    Tests the reset of login attempts after a successful login
+
+    Testing for:
+    - Successful login
+    - Successful login flash message
+    - Login attempts reset to 0
+    """
+    valid_data = {
+        'email': USER1_EMAIL,
+        'password': 'Password1'
+    }
+
+    with client:
+        # Start from a failed login attempt
+        with client.session_transaction() as sess:
+            sess['login_attempts'] = 1
+
+        # Simulate a successful login
+        response = client.post('/login', 
+            data=valid_data, follow_redirects=True)
+        
+        with client.session_transaction() as sess:
+            # Reset to 0
+            attempts = sess.get('login_attempts', 0)
+            assert attempts == 0
+            assert b'Home' in response.data
+
+
+def test_max_login_attempts_reached(client):
+    """
+    Tests the max login attempts reached signal
+
+    Testing for:
+    - Max login attempts reached signal received
+    - Max login attempts not reached signal received
+    - Invalid max login attempts reached signal received
+    - Flash messages received
+    """
+    invalid_data = {
+        'email': 'B@example.com',
+        'password': 'Incorrect123'
+    }
+    with client:
+        # Start the session at the max number of allowed failed login attempts;
+        # the counting itself is covered by test_login_attempts_increment
+        with client.session_transaction() as sess:
+            sess['login_attempts'] = MAX_LOGIN_ATTEMPTS
+
+        # The next attempt should redirect to /signup and flash a msg
+        response = client.post('/login', 
+            data=invalid_data, follow_redirects=True)
+        
+        assert response.status_code == 200
+        body = response.data
+        assert b'Signup' in body
+        assert b'Maximum sign-in attempts reached.' in body
+
+
+def test_login_attempts_increment(client):
+    """
+    Tests the incrementation of login attempts after failed logins
+
+    Testing for:
+    - Failed login attempt
+    - Login attempts incremented by 1
+    """
+
+    # Using valid form data but incorrect credentials
+    invalid_data = {
+        'email': 'B@example.com',
+        'password': 'Incorrect123'
+    }
+    
+    with client:
+        # Simulate two failed login attempts on a fresh session
+        client.post('/login', data=invalid_data)
+        client.post('/login', data=invalid_data)
+
+        # Each attempt added 1 to the counter
+        with client.session_transaction() as sess:
+            attempts = sess.get('login_attempts', 0)
+            assert attempts == 2
+
+
+
+def test_redis_max_login_attempts_reached(client, fake_redis):
+    """
+    Tests the Redis login rate limit once the max login attempts are used up
+
+    Testing for:
+    - Attempt beyond the limit redirected to the signup page
+    - Credentials never checked for the rejected attempt
+    - Flash message received
+    """
+    # Key of the test client's address, which Werkzeug sets to 127.0.0.1
+    with app.test_request_context(environ_base={'REMOTE_ADDR': '127.0.0.1'}):
+        key = login_attempts_key(USER1_EMAIL)
+    fake_redis.store[key] = MAX_LOGIN_ATTEMPTS
+
+    # Correct credentials are still turned away, before any password hash is checked
+    valid_data = {'email': USER1_EMAIL, 'password': 'Password1'}
+    with patch('app.auth.authenticate_and_login') as mock_authenticate:
+        response = client.post('/login', data=valid_data)
+    assert response.status_code == 302
+    assert response.location == '/signup'
+    mock_authenticate.assert_not_called()
+    assert fake_redis.store[key] == MAX_LOGIN_ATTEMPTS + 1
+
+    response = client.get(response.location)
+    assert b'Maximum sign-in attempts reached.' in response.data
+
+
+def test_redis_login_attempts_cleared(client, fake_redis):
+    """
+    Tests the reset of the Redis login attempts after a successful login
+
+    Testing for:
+    - Successful login below the limit
+    - Login attempts key removed
+    """
+    # Key of the test client's address, which Werkzeug sets to 127.0.0.1
+    with app.test_request_context(environ_base={'REMOTE_ADDR': '127.0.0.1'}):
+        key = login_attempts_key(USER1_EMAIL)
+    fake_redis.store[key] = 1
+
+    valid_data = {'email': USER1_EMAIL, 'password': 'Password1'}
+    response = client.post('/login', data=valid_data)
+    assert response.status_code == 302
+    assert response.location == '/'
+    assert key not in fake_redis.store
+
+
+def test_redis_user_cache(fake_redis):
+    """
+    Tests the Redis cache of users loaded by the login manager
+
+    Testing for:
+    - Cache miss loads the user from the database and caches it
+    - Cache hit reloads the user without a SELECT
+    - Forgotten user removed from the cache
+    """
+    key = user_cache_key(1)
+
+    # A miss loads the user from the database and caches it
+    assert load_cached_user('1').first_name == USER1_FIRST_NAME
+    assert key in fake_redis.store
+
+    # A hit rebuilds the user from the cache, with no statements sent to the database
+    db.session.expunge_all()
+    statements = []
+    record_statement = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db.engine, 'before_cursor_execute', record_statement)
+    try:
+        user1 = load_cached_user('1')
+        assert (user1.id, user1.email, user1.first_name) == (1, USER1_EMAIL, USER1_FIRST_NAME)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record_statement)
+    assert statements == []
+
+    # Forgetting the user drops the cache entry
+    forget_cached_user(1)
+    assert key not in fake_redis.store
+
+
+# Site route tests
+def test_home_route_as_guest(client):
+    """
+    Tests the home route as a guest
+
+    Testing for:
+    - Successful home route
+    - Successful home route flash message
+    """
+    response = client.get('/')
+    assert response.status_code == 200
+    assert b'Welcome to AutoSwipe, Guest.' in response.data
+
+
+def test_home_route_as_user(auth_client):
+    """
+    Tests the home route as a user
+
+    Testing for:
+    - Successful home route
+    - Successful home route flash message
+    """
+
+    # The test user's first name, known from the fixture
+    name = USER1_FIRST_NAME
+
+    # Test the home route
+    response = auth_client.get('/')
+    assert response.status_code == 200
+    assert f'Welcome to AutoSwipe, {name}.'.encode() in response.data
+
+
+# One test per route that requires a user to be logged in
+@pytest.mark.parametrize('route', GUEST_ROUTES)
+def test_routes_as_guest(route):
+    """
+    Tests a route that requires a user to be logged in
+
+    Testing for:
+    - Successful route redirect to the login page
+    """
+    status_code, headers, _ = get_as_guest(route)
+    assert status_code == 302
+    assert headers['Location'].startswith('/login')
+
+
+def test_guest_redirect_to_login_page(client):
+    """
+    Follows a guest's redirect from a route that requires a user to be logged in
+
+    Testing for:
+    - Successful login page after the redirect
+    - Login required flash message
+    """
+    response = client.get(GUEST_ROUTES[0], follow_redirects=True)
+    assert response.status_code == 200
+    assert response.request.path == '/login'
+    assert b'<title>Login</title>' in response.data
+    assert b'Please log in to access this page.' in response.data
+
+
+def test_explore_route(auth_client):
+    """
+    Tests the explore route
+
+    Testing for:
+    - Successful explore route
+    - Successful explore route flash message
+    """
+    response = auth_client.get('/explore')
+    assert response.status_code == 200
+    assert b'Explore' in response.data
+
+
+def test_saved_route(auth_client):
+    """
+    Tests the saved route
+
+    Testing for:
+    - Successful saved route
+    - Successful saved route flash message
+    """
+    response = auth_client.get('/saved')
+    assert response.status_code == 200
+    assert b'Saved' in response.data
+
+
+def test_single_view_route(auth_client):
+    """
+    Tests the single view route
+
+    Testing for:
+    - Successful single view route
+    - Successful single view route flash message
+    """
+    car_id = 1
+    response = auth_client.get(f'/saved/single-view/{car_id}')
+    assert response.status_code == 200
+    assert b'Single View' in response.data
+
+
+def test_settings_route(auth_client):
+    """
+    Tests the settings route
+
+    Testing for:
+    - Successful settings route
+    - Successful settings route flash message
+    """
+    response = auth_client.get('/settings')
+    assert response.status_code == 200
+    assert b'Settings' in response.data
+
+
+#   Error page tests
+def test_404_page():
+    """
+    Tests the 404 page
+
+    Testing for:
+    - Successful 404 page
+    - Successful 404 page flash message
+    """
+    status_code, _, body = get_as_guest(MISSING_ROUTE)
+    assert status_code == 404
+    assert b'404' in body
+
+
+@patch('app.views.db.session.commit', side_effect=IntegrityError('', '', ''))
+def test_500_page(mock_commit, auth_client):
+    """
+    Tests the 500 page through the react route
+
+    Testing for:
+    - Successful 500 page
+    - Successful 500 page flash message
+    """
+    response = auth_client.post(
+        '/react', data=REACT_BODY, content_type='application/json')
+    assert response.status_code == 500
+    assert 'Unable to commit' in response.get_json()['status']
+    mock_commit.assert_called_once()
+
+
+def test_pre_populate_integrity_error():
+    """
+    Tests that a failed seed of the Car table is rolled back
+
+    Testing for:
+    - Error response with the failure message
+    - Session usable again after the rollback
+    """
+    with app.test_request_context():
+        UserInteraction.query.delete()
+        Car.query.delete()
+        db.session.commit()
+
+        with patch('app.views.db.session.commit') as mock_commit:
+            mock_commit.side_effect = IntegrityError('INSERT', {}, Exception('duplicate'))
+            response, status = pre_populate_tblCars()
+        assert status == 500
+        data = response.get_json()
+        assert data['status'] == 'error'
+        assert 'duplicate' in data['message']
+
+        # The rollback leaves the session clean for the next request
+        assert Car.query.count() == 0